@@ -1,14 +1,16 @@
 """Logging configuration for the application."""
 
+import json
 import logging
 import os
 import sys
 
+import orjson
 import structlog
 
 # Set the log level
 LOGLEVEL = os.getenv("LOGLEVEL", "INFO").upper()
-_nameToLevel = {
+nameToLevel = {
     "CRITICAL": logging.CRITICAL,
     "FATAL": logging.FATAL,
     "ERROR": logging.ERROR,
@@ -19,6 +21,20 @@ _nameToLevel = {
     "NOTSET": logging.NOTSET,
 }
 
+
+def _orjson_dumps(obj: object, **kwargs) -> str:  # noqa: ARG001
+    """Serialize log events with orjson, sorting the keys as json.dumps(sort_keys=True) did.
+
+    Events orjson cannot encode, such as ints wider than 64 bits, fall back to json.dumps.
+    """
+    try:
+        return orjson.dumps(
+            obj, default=repr, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=repr, sort_keys=True)
+
+
 shared_processors = [
     structlog.stdlib.PositionalArgumentsFormatter(),
     structlog.processors.CallsiteParameterAdder(
@@ -47,12 +63,12 @@ else:
         *shared_processors,
         structlog.processors.EventRenamer("message", replace_by="_event"),
         structlog.processors.dict_tracebacks,
-        structlog.processors.JSONRenderer(sort_keys=True),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     ]
 
 # Add required processors and formatters to structlog
 structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(_nameToLevel[LOGLEVEL]),
+    wrapper_class=structlog.make_filtering_bound_logger(nameToLevel[LOGLEVEL]),
     processors=processors,
 )
 
@@ -4,37 +4,45 @@ import os
 import uvicorn
 import sentry_sdk
 
-from india_api import internal
+from india_api import LOGLEVEL, internal, nameToLevel
 from india_api.internal.config import Config
 from india_api.internal.service import get_db_client, server, version
 
 
 cfg = Config()
 
-sentry_sdk.init(
-    dsn=os.getenv("SENTRY_DSN"),
-    environment=os.getenv("ENVIRONMENT", "local"),
-    traces_sample_rate=1
-)
+# Only set up Sentry when there is somewhere to send the events
+if os.getenv("SENTRY_DSN"):
+    sentry_sdk.init(
+        dsn=os.getenv("SENTRY_DSN"),
+        environment=os.getenv("ENVIRONMENT", "local"),
+        traces_sample_rate=cfg.SENTRY_TRACES_SAMPLE_RATE,
+    )
 
-sentry_sdk.set_tag("app_name", "india_api")
-sentry_sdk.set_tag("version",version)
+    sentry_sdk.set_tag("app_name", "india_api")
+    sentry_sdk.set_tag("version",version)
 
 
+# A single client is shared by all requests, so the database connection pool is reused
 match cfg.SOURCE:
     case "indiadb":
         if cfg.DB_URL == "" or cfg.DB_URL is None:
             raise OSError(f"DB_URL env var is required using db source: {cfg.SOURCE}")
 
-        def get_db_client_override() -> internal.DatabaseInterface:
-            return internal.inputs.indiadb.Client(cfg.DB_URL)
+        db_client = internal.inputs.indiadb.Client(
+            cfg.DB_URL, pool_size=cfg.DB_POOL_SIZE, max_overflow=cfg.DB_MAX_OVERFLOW
+        )
     case "dummydb":
-
-        def get_db_client_override() -> internal.DatabaseInterface:
-            return internal.inputs.dummydb.Client()
+        db_client = internal.inputs.dummydb.Client()
     case _:
         raise ValueError(f"Unknown SOURCE: {cfg.SOURCE}. Expected 'dummydb'.")
 
+
+def get_db_client_override() -> internal.DatabaseInterface:
+    """Returns the database client shared by all requests."""
+    return db_client
+
+
 # Dependency inject the desired database client
 server.dependency_overrides[get_db_client] = get_db_client_override
 
@@ -42,12 +50,18 @@ server.dependency_overrides[get_db_client] = get_db_client_override
 def run() -> None:
     """Run the API using a uvicorn server."""
     uvicorn.run(
-        "india_api.internal.service.server:server",
+        # Worker and reload processes import the app from this module,
+        # so each sets up its own database client and dependency override
+        "india_api.cmd.main:server",
         host="0.0.0.0",
         port=cfg.PORT,
-        reload=True,
-        log_level="debug",
-        workers=1,
+        reload=cfg.RELOAD,
+        log_level=nameToLevel[LOGLEVEL],
+        # None lets uvicorn read WEB_CONCURRENCY, and run a single worker if it is not set
+        workers=cfg.WORKERS or None,
+        # uvloop is used where it is installed, which is everywhere but Windows and PyPy
+        loop="auto",
+        http="httptools",
     )
 
 
@@ -1,6 +1,5 @@
 """Config struct for application running."""
 import os
-from distutils.util import strtobool
 from typing import get_type_hints
 
 import structlog
@@ -8,6 +7,20 @@ import structlog
 log = structlog.getLogger()
 
 
+def strtobool(value: str) -> bool:
+    """Convert a string representation of truth to a bool.
+
+    Replaces distutils.util.strtobool, as distutils is removed in Python 3.12.
+    """
+    match value.lower():
+        case "y" | "yes" | "t" | "true" | "on" | "1":
+            return True
+        case "n" | "no" | "f" | "false" | "off" | "0":
+            return False
+        case _:
+            raise ValueError(f"Invalid truth value {value}")
+
+
 class EnvParser:
     """Mixin to parse environment variables into class fields.
 
@@ -16,6 +29,13 @@ class EnvParser:
     this small use case.
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Cache the type hints of the upper case fields when the child class is defined."""
+        super().__init_subclass__(**kwargs)
+        cls._env_fields = {
+            field: t for field, t in get_type_hints(cls).items() if field.isupper()
+        }
+
     def __init__(self) -> None:
         """Parse environment variables into class fields.
 
@@ -29,11 +49,7 @@ class EnvParser:
         >>>     OPTIONAL_ENV_VAR: str = "default value"
         >>>     ignored_var: str = "ignored"
         """
-        for field, t in get_type_hints(self).items():
-            # Skip item if not upper case
-            if not field.isupper():
-                continue
-
+        for field, t in self._env_fields.items():
             # Log Error if required field not supplied
             default_value = getattr(self, field, None)
             match (default_value, os.environ.get(field)):
@@ -48,7 +64,7 @@ class EnvParser:
                     env_value: str | bool = os.environ[field]
                     # Handle bools seperately as bool("False") == True
                     if t == bool:
-                        env_value = bool(strtobool(os.environ[field]))
+                        env_value = strtobool(os.environ[field])
                     # Cast to desired type
                     self.__setattr__(field, t(env_value))
 
@@ -61,3 +77,14 @@ class Config(EnvParser):
     PORT: int = 8000
     AUTH0_DOMAIN: str = ""
     AUTH0_API_AUDIENCE: str = ""
+    # Number of uvicorn worker processes, 0 uses WEB_CONCURRENCY if set, otherwise 1.
+    # More workers are opt-in, as each opens its own database connection pool (see below)
+    WORKERS: int = 0
+    # Restart the server on code changes, for local development only
+    RELOAD: bool = False
+    # Database connections kept open, and extra connections allowed, per worker process.
+    # WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must fit within the database's max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Fraction of requests traced by Sentry
+    SENTRY_TRACES_SAMPLE_RATE: float = 0.01
@@ -0,0 +1,37 @@
+import pytest
+
+from .env import EnvParser, strtobool
+
+
+class ExampleEnv(EnvParser):
+    REQUIRED_VAR: str
+    OPTIONAL_VAR: int = 1
+    FLAG_VAR: bool = False
+    ignored_var: str = "ignored"
+
+
+def test_env_parser(monkeypatch):
+    monkeypatch.setenv("REQUIRED_VAR", "value")
+    monkeypatch.setenv("FLAG_VAR", "True")
+
+    env = ExampleEnv()
+
+    assert env.REQUIRED_VAR == "value"
+    assert env.OPTIONAL_VAR == 1
+    assert env.FLAG_VAR is True
+    assert "ignored_var" not in ExampleEnv._env_fields
+
+
+def test_env_parser_missing_required_field(monkeypatch):
+    monkeypatch.delenv("REQUIRED_VAR", raising=False)
+
+    with pytest.raises(OSError):
+        ExampleEnv()
+
+
+def test_strtobool():
+    assert strtobool("yes") is True
+    assert strtobool("0") is False
+
+    with pytest.raises(ValueError):
+        strtobool("maybe")
@@ -0,0 +1,123 @@
+"""Numerical kernels used to generate the dummy database's data.
+
+The kernels operate on whole arrays of times at once. When numba is installed
+they are compiled to native code, otherwise they run as plain NumPy.
+Random numbers are drawn by the caller and passed in, as numba keeps its own
+random state which np.random.seed does not reach.
+"""
+import math
+from typing import Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional dependency, so fall back to the uncompiled functions
+
+    def njit(**kwargs: object) -> Callable[[Callable], Callable]:  # noqa: ARG001
+        """Stands in for numba.njit, returning the function unchanged."""
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+
+# translateY modulates the solar base function based on the month, indexed by month (1-12).
+# * + 0.5 at the summer solstice
+# * - 0.5 at the winter solstice
+_translateYByMonth = np.sin((math.pi / 6) * np.arange(13) - math.pi / 2) / 2.0
+# The noise base function only depends on the whole hour, so is indexed by hour (0-23).
+# It is the product of long and short sines, with very small amplitude around 1
+_noiseByHour = (np.sin(math.pi * np.arange(24)) / 20) * np.sin(math.pi * np.arange(24) / 3) + 1
+
+
+@njit(cache=True)
+def monthOfUnixTime(timesUnix: np.ndarray) -> np.ndarray:
+    """Gets the month (1-12) of each of the unix times, using only integer arithmetic.
+
+    This is the month part of the days to civil date algorithm from
+    https://howardhinnant.github.io/date_algorithms.html#civil_from_days,
+    which counts years from March so that the leap day falls at the end.
+    """
+    # Days since 0000-03-01
+    days = timesUnix // 86400 + 719468
+    # Day of the 400 year era, and year of the era, in which the time falls
+    dayOfEra = days % 146097
+    yearOfEra = (dayOfEra - dayOfEra // 1460 + dayOfEra // 36524 - dayOfEra // 146096) // 365
+    # Day of the year counting from the 1st of March, then the month counting from March as 0
+    dayOfYear = dayOfEra - (365 * yearOfEra + yearOfEra // 4 - yearOfEra // 100)
+    monthFromMarch = (5 * dayOfYear + 2) // 153
+    return (monthFromMarch + 2) % 12 + 1
+
+
+@njit(cache=True, fastmath=True)
+def solarPowerProductionKernel(
+    timesUnix: np.ndarray, randoms: np.ndarray, scaleFactor: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes fake solar PowerProductions and Uncertainties for the input times.
+
+    The basic PowerProduction function is built from a sine wave
+    with a period of 24 hours, peaking at 12 hours.
+    Further convolutions modify the value according to time of year.
+
+    Args:
+        timesUnix: The times in unix time.
+        randoms: Uniform random numbers in [0, 1), with shape (3, len(timesUnix)).
+        scaleFactor: The scale factor for the sine wave.
+            A scale factor of 10000 will result in a peak PowerProduction of 10 kW.
+    """
+    # The functions x values are hours, so convert the time to hours.
+    # Only the time of day matters, as the period of the function is 24 hours
+    secondOfDay = timesUnix % 86400
+    hour = secondOfDay / 3600
+    wholeHour = secondOfDay // 3600
+    month = monthOfUnixTime(timesUnix)
+
+    # scaleX makes the period of the function 24 hours
+    scaleX = math.pi / 12
+    # translateX moves the minimum of the function to 0 hours
+    translateX = -math.pi / 2
+    # translateY modulates the base function based on the month
+    translateY = _translateYByMonth[month]
+
+    # basefunc ranges between -1 and 1 with a period of 24 hours,
+    # peaking at 12 hours.
+    # translateY changes the min and max to range between 1.5 and -1.5
+    # depending on the month.
+    basefunc = np.sin(scaleX * hour + translateX) + translateY
+    # Remove negative values
+    basefunc = np.maximum(0, basefunc)
+    # Steepen the curve. The divisor is based on the max value
+    basefunc = basefunc**4 / 1.5**4
+
+    # Instead of completely random noise, modulate the base noise function for the hour
+    noise = _noiseByHour[wholeHour] * randoms[0] / 20 + 0.97
+
+    # Create the output values from the base function, noise, and scale factor
+    output = basefunc * noise * scaleFactor
+
+    # Add some random Uncertainty. Where the output is 0, so is the Uncertainty
+    uncertaintyLow = output - (randoms[1] * output / 10)
+    uncertaintyHigh = output + (randoms[2] * output / 10)
+
+    return output, uncertaintyLow, uncertaintyHigh
+
+
+@njit(cache=True, fastmath=True)
+def windPowerProductionKernel(
+    _timesUnix: np.ndarray, randoms: np.ndarray, scaleFactor: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes fake wind PowerProductions and Uncertainties for the input times.
+
+    The times are unused, as the wind is random at every time, but the signature
+    is kept to match solarPowerProductionKernel.
+    randoms holds uniform random numbers in [0, 1), with shape (3, len(timesUnix)).
+    """
+    output = np.minimum(scaleFactor, scaleFactor * 10 * randoms[0])
+
+    uncertaintyLow = output - (randoms[1] * output / 10)
+    uncertaintyHigh = output + (randoms[2] * output / 10)
+
+    return output, uncertaintyLow, uncertaintyHigh
@@ -1,10 +1,16 @@
 import dataclasses as dc
 
+import numpy as np
 
-@dc.dataclass
+
+@dc.dataclass(slots=True, frozen=True)
 class DummyDBPredictedPowerProduction:
-    """Structure of the predicted Power Production data from the dummy database."""
+    """Structure of the predicted Power Production data from the dummy database.
+
+    Each field holds one value per time step.
+    """
 
-    PowerProductionKW: float
-    UncertaintyLow: float
-    UncertaintyHigh: float
+    TimeUnix: np.ndarray
+    PowerProductionKW: np.ndarray
+    UncertaintyLow: np.ndarray
+    UncertaintyHigh: np.ndarray
@@ -1,29 +1,43 @@
 """A dummy database that conforms to the DatabaseInterface."""
+import dataclasses as dc
 import datetime as dt
-import math
-import random
-from uuid import uuid4
-from typing import Optional
+import functools
+import time
+import zlib
+from uuid import UUID, uuid4
+from typing import Callable, Optional
 
+import numpy as np
 
 from india_api import internal
 from india_api.internal.models import ForecastHorizon
 
+from ._kernels import solarPowerProductionKernel, windPowerProductionKernel
 from ._models import DummyDBPredictedPowerProduction
 from ..utils import get_window
 
 # step defines the time interval between each data point
 step: dt.timedelta = dt.timedelta(minutes=15)
+# generated data is reused for this many seconds before being regenerated
+cacheSeconds: int = 300
+# rng is the default generator of random numbers for the PowerProduction functions
+rng: np.random.Generator = np.random.default_rng()
 
 
 class Client(internal.DatabaseInterface):
     """Defines a dummy database that conforms to the DatabaseInterface."""
 
+    def __init__(self) -> None:
+        """Generates the current data, so the kernels are compiled before the first request."""
+        self.get_solar_power_production_arrays(location="")
+        self.get_wind_power_production_arrays(location="")
+
     def get_predicted_solar_power_production_for_location(
         self,
         location: str,
         forecast_horizon: ForecastHorizon = ForecastHorizon.latest,
         forecast_horizon_minutes: Optional[int] = None,
+        smooth_flag: bool = True,
     ) -> list[internal.PredictedPower]:
         """Gets the predicted solar power production for a location.
 
@@ -31,30 +45,16 @@ class Client(internal.DatabaseInterface):
             location: The location to get the predicted solar power production for.
             forecast_horizon: The time horizon to get the data for. Can be latest or day ahead
             forecast_horizon_minutes: this is not used
+            smooth_flag: this is not used
         """
-        # Get the window
-        start, end = get_window()
-        numSteps = int((end - start) / step)
-        values: list[internal.PredictedPower] = []
-
-        for i in range(numSteps):
-            time = start + i * step
-            _PowerProduction = _basicSolarPowerProductionFunc(int(time.timestamp()))
-            values.append(
-                internal.PredictedPower(
-                    Time=time,
-                    PowerKW=int(_PowerProduction.PowerProductionKW),
-                    CreatedTime=dt.datetime.now(tz=dt.UTC),
-                ),
-            )
-
-        return values
+        return _toPredictedPower(self.get_solar_power_production_arrays(location))
 
     def get_predicted_wind_power_production_for_location(
         self,
         location: str,
         forecast_horizon: ForecastHorizon = ForecastHorizon.latest,
         forecast_horizon_minutes: Optional[int] = None,
+        smooth_flag: bool = True,
     ) -> list[internal.PredictedPower]:
         """Gets the predicted wind power production for a location.
 
@@ -62,66 +62,29 @@ class Client(internal.DatabaseInterface):
             location: The location to get the predicted wind power production for.
             forecast_horizon: The time horizon to get the data for. Can be latest or day ahead
             forecast_horizon_minutes: this is not used but needed for function signature
+            smooth_flag: this is not used but needed for function signature
         """
-        # Get the window
-        start, end = get_window()
-        numSteps = int((end - start) / step)
-        values: list[internal.PredictedPower] = []
-
-        for i in range(numSteps):
-            time = start + i * step
-            _PowerProduction = _basicWindPowerProductionFunc(int(time.timestamp()))
-            values.append(
-                internal.PredictedPower(
-                    Time=time,
-                    PowerKW=int(_PowerProduction.PowerProductionKW),
-                    CreatedTime=dt.datetime.now(tz=dt.UTC),
-                ),
-            )
-
-        return values
+        return _toPredictedPower(self.get_wind_power_production_arrays(location))
 
     def get_actual_solar_power_production_for_location(
         self, location: str
     ) -> list[internal.ActualPower]:
         """Gets the actual solar power production for a location."""
-        # Get the window
-        start, end = get_window()
-        numSteps = int((end - start) / step)
-        values: list[internal.ActualPower] = []
-
-        for i in range(numSteps):
-            time = start + i * step
-            _PowerProduction = _basicSolarPowerProductionFunc(int(time.timestamp()))
-            values.append(
-                internal.ActualPower(
-                    Time=time,
-                    PowerKW=int(_PowerProduction.PowerProductionKW),
-                ),
-            )
-
-        return values
+        return _toActualPower(self.get_solar_power_production_arrays(location))
 
     def get_actual_wind_power_production_for_location(
         self, location: str
     ) -> list[internal.ActualPower]:
         """Gets the actual wind power production for a location."""
-        # Get the window
-        start, end = get_window()
-        numSteps = int((end - start) / step)
-        values: list[internal.ActualPower] = []
-
-        for i in range(numSteps):
-            time = start + i * step
-            _PowerProduction = _basicWindPowerProductionFunc(int(time.timestamp()))
-            values.append(
-                internal.ActualPower(
-                    Time=time,
-                    PowerKW=int(_PowerProduction.PowerProductionKW),
-                ),
-            )
+        return _toActualPower(self.get_wind_power_production_arrays(location))
 
-        return values
+    def get_solar_power_production_arrays(self, location: str) -> DummyDBPredictedPowerProduction:
+        """Gets the solar power production for a location, as arrays over the window."""
+        return _getCachedPowerProduction(_basicSolarPowerProductionFunc, *_getCacheKey())
+
+    def get_wind_power_production_arrays(self, location: str) -> DummyDBPredictedPowerProduction:
+        """Gets the wind power production for a location, as arrays over the window."""
+        return _getCachedPowerProduction(_basicWindPowerProductionFunc, *_getCacheKey())
 
     def get_wind_regions(self) -> list[str]:
         """Gets the valid wind regions."""
@@ -151,7 +114,7 @@ class Client(internal.DatabaseInterface):
         return [site]
 
     def get_site_forecast(
-        self, site_uuid: str, email: Optional[str] = None
+        self, site_uuid: UUID, email: Optional[str] = None
     ) -> list[internal.PredictedPower]:
         """Get a forecast for a site, this is for a solar site"""
 
@@ -160,7 +123,7 @@ class Client(internal.DatabaseInterface):
         return values
 
     def get_site_generation(
-        self, site_uuid: str, email: Optional[str] = None
+        self, site_uuid: UUID, email: Optional[str] = None
     ) -> list[internal.ActualPower]:
         """Get the generation for a site, this is for a solar site"""
 
@@ -169,87 +132,135 @@ class Client(internal.DatabaseInterface):
         return values
 
     def post_site_generation(
-        self, site_uuid: str, generation: list[internal.ActualPower], email: Optional[str] = None
+        self, site_uuid: UUID, generation: list[internal.ActualPower], email: Optional[str] = None
     ):
         """Post generation for a site"""
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _getTimesUnix(start: dt.datetime, end: dt.datetime) -> np.ndarray:
+    """Gets the unix times of each step in the window, as a read only array of ints."""
+    timesUnix = np.arange(
+        int(start.timestamp()),
+        int(end.timestamp()),
+        int(step.total_seconds()),
+        dtype=np.int64,
+    )
+    timesUnix.flags.writeable = False
+    return timesUnix
+
+
+@functools.lru_cache(maxsize=1)
+def _getTimes(startUnix: int, numSteps: int) -> tuple[dt.datetime, ...]:
+    """Gets the datetime of each step, starting from the unix time startUnix."""
+    stepSeconds = int(step.total_seconds())
+    return tuple(
+        dt.datetime.fromtimestamp(startUnix + i * stepSeconds, tz=dt.UTC) for i in range(numSteps)
+    )
+
+
+def _getTimesOf(powerProduction: DummyDBPredictedPowerProduction) -> tuple[dt.datetime, ...]:
+    """Gets the datetimes of the PowerProduction's steps, shared between calls."""
+    return _getTimes(int(powerProduction.TimeUnix[0]), len(powerProduction.TimeUnix))
+
+
+def _toPredictedPower(
+    powerProduction: DummyDBPredictedPowerProduction,
+) -> list[internal.PredictedPower]:
+    """Converts the PowerProduction arrays to a list of PredictedPower in whole kW, created now."""
+    createdTime = dt.datetime.now(tz=dt.UTC)
+
+    return [
+        internal.PredictedPower(Time=stepTime, PowerKW=powerKW, CreatedTime=createdTime)
+        for stepTime, powerKW in zip(
+            _getTimesOf(powerProduction),
+            np.trunc(powerProduction.PowerProductionKW).tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _toActualPower(
+    powerProduction: DummyDBPredictedPowerProduction,
+) -> list[internal.ActualPower]:
+    """Converts the PowerProduction arrays to a list of ActualPower in whole kW."""
+    return [
+        internal.ActualPower(Time=stepTime, PowerKW=powerKW)
+        for stepTime, powerKW in zip(
+            _getTimesOf(powerProduction),
+            np.trunc(powerProduction.PowerProductionKW).tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _getCacheKey() -> tuple[dt.datetime, dt.datetime, int]:
+    """Gets the window and the current cache bucket, which key the cached data."""
+    start, end = get_window()
+    return start, end, int(time.time()) // cacheSeconds
+
+
+@functools.lru_cache(maxsize=8)
+def _getCachedPowerProduction(
+    powerProductionFunc: Callable[..., DummyDBPredictedPowerProduction],
+    start: dt.datetime,
+    end: dt.datetime,
+    bucket: int,
+) -> DummyDBPredictedPowerProduction:
+    """Gets the PowerProductions over the window, reusing them within a cache bucket.
+
+    The random numbers are seeded from the bucket and the function's name, so every
+    process generates the same data within a bucket. The arrays are made read only,
+    as they are shared between callers.
+    """
+    seed = (bucket, zlib.crc32(powerProductionFunc.__name__.encode()))
+    powerProduction = powerProductionFunc(
+        _getTimesUnix(start, end), generator=np.random.default_rng(seed)
+    )
+    for field in dc.fields(powerProduction):
+        getattr(powerProduction, field.name).flags.writeable = False
+    return powerProduction
+
+
 def _basicSolarPowerProductionFunc(
-    timeUnix: int, scaleFactor: int = 10000
+    timesUnix: np.ndarray, scaleFactor: int = 10000, generator: np.random.Generator = rng
 ) -> DummyDBPredictedPowerProduction:
-    """Gets a fake solar PowerProduction for the input time.
+    """Gets fake solar PowerProductions for the input times.
 
-    The basic PowerProduction function is built from a sine wave
-    with a period of 24 hours, peaking at 12 hours.
-    Further convolutions modify the value according to time of year.
+    See solarPowerProductionKernel for the shape of the function.
 
     Args:
-        timeUnix: The time in unix time.
+        timesUnix: The times in unix time, as an array of ints.
         scaleFactor: The scale factor for the sine wave.
             A scale factor of 10000 will result in a peak PowerProduction of 10 kW.
+        generator: The generator to draw the random numbers from.
     """
-    # Create a datetime object from the unix time
-    time = dt.datetime.fromtimestamp(timeUnix, tz=dt.UTC)
-    # The functions x values are hours, so convert the time to hours
-    hour = time.day * 24 + time.hour + time.minute / 60 + time.second / 3600
-
-    # scaleX makes the period of the function 24 hours
-    scaleX = math.pi / 12
-    # translateX moves the minimum of the function to 0 hours
-    translateX = -math.pi / 2
-    # translateY modulates the base function based on the month.
-    # * + 0.5 at the summer solstice
-    # * - 0.5 at the winter solstice
-    translateY = math.sin((math.pi / 6) * time.month + translateX) / 2.0
-
-    # basefunc ranges between -1 and 1 with a period of 24 hours,
-    # peaking at 12 hours.
-    # translateY changes the min and max to range between 1.5 and -1.5
-    # depending on the month.
-    basefunc = math.sin(scaleX * hour + translateX) + translateY
-    # Remove negative values
-    basefunc = max(0, basefunc)
-    # Steepen the curve. The divisor is based on the max value
-    basefunc = basefunc ** 4 / 1.5 ** 4
-
-    # Instead of completely random noise, apply based on the following process:
-    # * A base noise function which is the product of long and short sines
-    # * The resultant function modulates with very small amplitude around 1
-    noise = (math.sin(math.pi * time.hour) / 20) * (math.sin(math.pi * time.hour / 3)) + 1
-    noise = noise * random.random() / 20 + 0.97
-
-    # Create the output value from the base function, noise, and scale factor
-    output = basefunc * noise * scaleFactor
-
-    # Add some random Uncertaintyor
-    UncertaintyLow: float = 0.0
-    UncertaintyHigh: float = 0.0
-    if output > 0:
-        UncertaintyLow = output - (random.random() * output / 10)
-        UncertaintyHigh = output + (random.random() * output / 10)
+    randoms = generator.random((3, len(timesUnix)))
+    output, uncertaintyLow, uncertaintyHigh = solarPowerProductionKernel(
+        timesUnix, randoms, scaleFactor
+    )
 
     return DummyDBPredictedPowerProduction(
+        TimeUnix=timesUnix,
         PowerProductionKW=output,
-        UncertaintyLow=UncertaintyLow,
-        UncertaintyHigh=UncertaintyHigh,
+        UncertaintyLow=uncertaintyLow,
+        UncertaintyHigh=uncertaintyHigh,
     )
 
 
 def _basicWindPowerProductionFunc(
-    timeUnix: int, scaleFactor: int = 10000
+    timesUnix: np.ndarray, scaleFactor: int = 10000, generator: np.random.Generator = rng
 ) -> DummyDBPredictedPowerProduction:
-    """Gets a fake wind PowerProduction for the input time."""
-    output = min(scaleFactor, scaleFactor * 10 * random.random())
-
-    UncertaintyLow: float = 0.0
-    UncertaintyHigh: float = 0.0
-    if output > 0:
-        UncertaintyLow = output - (random.random() * output / 10)
-        UncertaintyHigh = output + (random.random() * output / 10)
+    """Gets fake wind PowerProductions for the input times."""
+    randoms = generator.random((3, len(timesUnix)))
+    output, uncertaintyLow, uncertaintyHigh = windPowerProductionKernel(
+        timesUnix, randoms, scaleFactor
+    )
 
     return DummyDBPredictedPowerProduction(
+        TimeUnix=timesUnix,
         PowerProductionKW=output,
-        UncertaintyLow=UncertaintyLow,
-        UncertaintyHigh=UncertaintyHigh,
+        UncertaintyLow=uncertaintyLow,
+        UncertaintyHigh=uncertaintyHigh,
     )
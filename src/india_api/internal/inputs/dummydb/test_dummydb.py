@@ -1,6 +1,10 @@
+import datetime as dt
 import unittest
 
-from .client import Client
+import numpy as np
+
+from ._kernels import monthOfUnixTime, solarPowerProductionKernel
+from .client import Client, _basicSolarPowerProductionFunc, _getCachedPowerProduction
 
 from india_api.internal import ActualPower
 
@@ -28,6 +32,37 @@ class TestDummyDatabase(unittest.TestCase):
         out = client.get_actual_solar_power_production_for_location(locID)
         self.assertIsNotNone(out)
 
+    def test_get_solar_power_production_arrays(self) -> None:
+        out = client.get_solar_power_production_arrays("testID")
+        self.assertEqual(len(out.TimeUnix), len(out.PowerProductionKW))
+        self.assertTrue((out.PowerProductionKW >= 0).all())
+        self.assertTrue((out.UncertaintyLow <= out.UncertaintyHigh).all())
+
+    def test_get_power_production_arrays_cached(self) -> None:
+        out = client.get_solar_power_production_arrays("testID")
+        self.assertIs(out, client.get_solar_power_production_arrays("testID"))
+        self.assertFalse(out.PowerProductionKW.flags.writeable)
+
+    def test_cached_power_production_is_seeded_by_bucket(self) -> None:
+        start, end = dt.datetime(2024, 6, 1, tzinfo=dt.UTC), dt.datetime(2024, 6, 3, tzinfo=dt.UTC)
+        generate = _getCachedPowerProduction.__wrapped__
+        first = generate(_basicSolarPowerProductionFunc, start, end, 1)
+        np.testing.assert_array_equal(
+            first.PowerProductionKW,
+            generate(_basicSolarPowerProductionFunc, start, end, 1).PowerProductionKW,
+        )
+        self.assertFalse(
+            np.array_equal(
+                first.PowerProductionKW,
+                generate(_basicSolarPowerProductionFunc, start, end, 2).PowerProductionKW,
+            )
+        )
+
+    def test_get_wind_power_production_arrays(self) -> None:
+        out = client.get_wind_power_production_arrays("testID")
+        self.assertEqual(len(out.TimeUnix), len(out.PowerProductionKW))
+        self.assertTrue((out.PowerProductionKW <= 10000).all())
+
     def test_get_wind_regions(self) -> None:
         out = client.get_wind_regions()
         self.assertIsNotNone(out)
@@ -52,3 +87,17 @@ class TestDummyDatabase(unittest.TestCase):
         client.post_site_generation(
             site_uuid="testID", generation=[ActualPower(Time=1, PowerKW=1)]
         )
+
+    def test_month_of_unix_time(self) -> None:
+        # Every 6 hours from 1970 to 2100, covering leap years and century years
+        timesUnix = np.arange(0, 4102444800, 6 * 3600, dtype=np.int64)
+        expected = timesUnix.astype("datetime64[s]").astype("datetime64[M]").astype(int) % 12 + 1
+        np.testing.assert_array_equal(monthOfUnixTime(timesUnix), expected)
+
+    def test_solar_power_production_kernel_uses_given_randoms(self) -> None:
+        timesUnix = np.arange(1718000000, 1718086400, 900, dtype=np.int64)
+        randoms = np.random.default_rng(0).random((3, len(timesUnix)))
+        first = solarPowerProductionKernel(timesUnix, randoms, 10000)
+        second = solarPowerProductionKernel(timesUnix, randoms, 10000)
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
@@ -1,49 +1,70 @@
 """India DB client that conforms to the DatabaseInterface."""
 import os
 import datetime as dt
-import pandas as pd
+import functools
 import logging
+import threading
+import time
 from typing import Optional
 from fastapi import HTTPException
 from uuid import UUID
 import sentry_sdk
 
-from pvsite_datamodel import DatabaseConnection
 from pvsite_datamodel.read import (
-    get_sites_by_country,
-    get_latest_forecast_values_by_site,
-    get_pv_generation_by_sites,
     get_user_by_email,
     get_sites_from_user,
     get_site_by_uuid,
 )
-from pvsite_datamodel.write.generation import insert_generation_values
-from pvsite_datamodel.sqlmodels import SiteAssetType, ForecastValueSQL
+from pvsite_datamodel.sqlmodels import SiteAssetType
 from pvsite_datamodel.write.database import save_api_call_to_db
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from india_api import internal
 from india_api.internal.inputs.utils import get_window
+from india_api.internal.inputs.indiadb.read import (
+    get_generation_by_location,
+    get_generation_by_site,
+    get_latest_forecast_values,
+    get_site_by_location,
+    get_site_uuids_by_email,
+)
 from india_api.internal.inputs.indiadb.smooth import smooth_forecast
+from india_api.internal.inputs.indiadb.write import insert_generation
 from india_api.internal.models import ForecastHorizon
 
 log = logging.getLogger(__name__)
 
+# Sites rarely change, so the site found for a location is reused for this many seconds
+site_cache_seconds = 300
+
 
 class Client(internal.DatabaseInterface):
     """Defines India DB client that conforms to the DatabaseInterface."""
 
     session: Session = None
 
-    def __init__(self, database_url: str) -> None:
-        """Initialize the client with a SQLAlchemy database connection and session."""
+    def __init__(self, database_url: str, pool_size: int = 5, max_overflow: int = 10) -> None:
+        """Initialize the client with a SQLAlchemy database connection and session.
+
+        Args:
+            database_url: The url of the database to connect to
+            pool_size: The number of connections kept open in the pool
+            max_overflow: The number of extra connections opened when the pool is in use
+        """
 
-        self.connection = DatabaseConnection(url=database_url, echo=False)
+        self._sessionmaker = _get_sessionmaker(database_url, pool_size, max_overflow)
+        # The uuid and ml model name of the site found for each location and asset type,
+        # only holding entries from the current cache bucket.
+        # The client is shared by the threads serving requests, so the lock guards both
+        self._sites_lock = threading.Lock()
+        self._sites_bucket: int = -1
+        self._sites: dict[tuple[str, SiteAssetType], tuple[UUID, Optional[str]]] = {}
 
     def _get_session(self):
         """Allows for overriding the default session (useful for testing)"""
         if self.session is None:
-            return self.connection.get_session()
+            return self._sessionmaker()
         else:
             return self.session
 
@@ -55,6 +76,38 @@ class Client(internal.DatabaseInterface):
             user = get_user_by_email(session, email)
             save_api_call_to_db(url=url, session=session, user=user)
 
+    def _get_site_for_location(
+        self, session: Session, location: str, asset_type: SiteAssetType
+    ) -> Optional[tuple[UUID, Optional[str]]]:
+        """Gets the uuid and ml model name of the site for a location and region.
+
+        Found sites are reused for site_cache_seconds. Only the uuid and model name are kept,
+        so no ORM object outlives its session. Sites that are not found are not cached.
+        """
+        key = (location, asset_type)
+        bucket = int(time.time()) // site_cache_seconds
+        with self._sites_lock:
+            # Only move forward, as a thread may have read the clock just before a rollover
+            if bucket > self._sites_bucket:
+                self._sites_bucket, self._sites = bucket, {}
+            sites = self._sites
+            cached = sites.get(key)
+
+        if cached is not None:
+            return cached
+
+        # Look the site up without holding the lock, so other locations are not held up
+        site = get_site_by_location(session, location, asset_type, region=location)
+        if site is None:
+            return None
+        ml_model_name = site.ml_model.name if site.ml_model is not None else None
+        cached = (site.site_uuid, ml_model_name)
+
+        with self._sites_lock:
+            sites[key] = cached
+
+        return cached
+
     def get_predicted_power_production_for_location(
         self,
         location: str,
@@ -93,41 +146,34 @@ class Client(internal.DatabaseInterface):
 
         # get site uuid
         with self._get_session() as session:
-            sites = get_sites_by_country(session, country="india", client_name=location)
+            site = self._get_site_for_location(session, location, asset_type)
 
-            # just select wind site and region
-            sites = [s for s in sites if (s.asset_type == asset_type) and (s.region == location)]
-
-            if len(sites) == 0:
+            if site is None:
                 raise HTTPException(
                     status_code=204,
                     detail=f"Site for {location=} not found and {asset_type=} not found",
                 )
 
-            site = sites[0]
-
-            if site.ml_model is not None:
-                ml_model_name = site.ml_model.name
+            site_uuid, site_ml_model_name = site
+            if site_ml_model_name is not None:
+                ml_model_name = site_ml_model_name
             log.info(f"Using ml model {ml_model_name}")
 
-            # read actual generations
-            values = get_latest_forecast_values_by_site(
+            # read the latest forecast values
+            forecast_values = get_latest_forecast_values(
                 session,
-                site_uuids=[site.site_uuid],
+                site_uuid=site_uuid,
                 start_utc=start,
+                model_name=ml_model_name,
                 day_ahead_hours=day_ahead_hours,
                 day_ahead_timezone_delta_hours=day_ahead_timezone_delta_hours,
                 forecast_horizon_minutes=forecast_horizon_minutes,
-                model_name=ml_model_name,
             )
-            forecast_values: [ForecastValueSQL] = values[site.site_uuid]
 
-        # convert ForecastValueSQL to PredictedPower
+        # convert forecast value rows to PredictedPower
         values = [
             internal.PredictedPower(
-                PowerKW=int(value.forecast_power_kw)
-                if value.forecast_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                PowerKW=value.power_kw,
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
                 CreatedTime=value.created_utc.replace(tzinfo=dt.UTC),
             )
@@ -150,25 +196,24 @@ class Client(internal.DatabaseInterface):
         # Get the window
         start, end = get_window()
 
-        # get site uuid
+        # read actual generations of the location's site
         with self._get_session() as session:
-            sites = get_sites_by_country(session, country="india", client_name=location)
-
-            # just select wind site
-            sites = [site for site in sites if site.asset_type == asset_type]
-            site = sites[0]
-
-            # read actual generations
-            values = get_pv_generation_by_sites(
-                session=session, site_uuids=[site.site_uuid], start_utc=start, end_utc=end
+            values = get_generation_by_location(
+                session, location, asset_type, start_utc=start, end_utc=end
             )
 
-        # convert from GenerationSQL to ActualPower
+            # The site is only looked up on its own when there is no generation,
+            # to tell a missing site from a site with no generation in the window
+            if len(values) == 0 and get_site_by_location(session, location, asset_type) is None:
+                raise HTTPException(
+                    status_code=204,
+                    detail=f"Site for {location=} not found and {asset_type=} not found",
+                )
+
+        # convert generation rows to ActualPower
         values = [
             internal.ActualPower(
-                PowerKW=int(value.generation_power_kw)
-                if value.generation_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                PowerKW=value.power_kw,
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
             )
             for value in values
@@ -264,9 +309,8 @@ class Client(internal.DatabaseInterface):
             user = get_user_by_email(session, email)
             sites_sql = get_sites_from_user(session, user=user)
 
-            sites = []
-            for site_sql in sites_sql:
-                site = internal.Site(
+            sites = [
+                internal.Site(
                     site_uuid=str(site_sql.site_uuid),
                     client_site_name=site_sql.client_site_name,
                     orientation=site_sql.orientation,
@@ -275,11 +319,12 @@ class Client(internal.DatabaseInterface):
                     latitude=site_sql.latitude,
                     longitude=site_sql.longitude,
                 )
-                sites.append(site)
+                for site_sql in sites_sql
+            ]
 
             return sites
 
-    def get_site_forecast(self, site_uuid: str, email: str) -> list[internal.PredictedPower]:
+    def get_site_forecast(self, site_uuid: UUID, email: str) -> list[internal.PredictedPower]:
         """Get a forecast for a site, this is for a solar site"""
 
         # TODO feels like there is some duplicated code here which could be refactored
@@ -299,20 +344,14 @@ class Client(internal.DatabaseInterface):
                 ml_model_name = site.ml_model.name
             log.info(f"Using ml model {ml_model_name}")
 
-            if isinstance(site_uuid, str):
-                site_uuid = UUID(site_uuid)
-
-            values = get_latest_forecast_values_by_site(
-                session, site_uuids=[site_uuid], start_utc=start, model_name=ml_model_name
+            forecast_values = get_latest_forecast_values(
+                session, site_uuid=site_uuid, start_utc=start, model_name=ml_model_name
             )
-            forecast_values: [ForecastValueSQL] = values[site_uuid]
 
-            # convert ForecastValueSQL to PredictedPower
+            # convert forecast value rows to PredictedPower
         values = [
             internal.PredictedPower(
-                PowerKW=int(value.forecast_power_kw)
-                if value.forecast_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                PowerKW=value.power_kw,
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
                 CreatedTime=value.created_utc.replace(tzinfo=dt.UTC),
             )
@@ -321,7 +360,7 @@ class Client(internal.DatabaseInterface):
 
         return values
 
-    def get_site_generation(self, site_uuid: str, email: str) -> list[internal.ActualPower]:
+    def get_site_generation(self, site_uuid: UUID, email: str) -> list[internal.ActualPower]:
         """Get the generation for a site, this is for a solar site"""
 
         # TODO feels like there is some duplicated code here which could be refactored
@@ -332,20 +371,15 @@ class Client(internal.DatabaseInterface):
         with self._get_session() as session:
             check_user_has_access_to_site(session=session, email=email, site_uuid=site_uuid)
 
-            if isinstance(site_uuid, str):
-                site_uuid = UUID(site_uuid)
-
             # read actual generations
-            values = get_pv_generation_by_sites(
-                session=session, site_uuids=[site_uuid], start_utc=start, end_utc=end
+            values = get_generation_by_site(
+                session=session, site_uuid=site_uuid, start_utc=start, end_utc=end
             )
 
-        # convert from GenerationSQL to PredictedPower
+        # convert generation rows to ActualPower
         values = [
             internal.ActualPower(
-                PowerKW=int(value.generation_power_kw)
-                if value.generation_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                PowerKW=value.power_kw,
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
             )
             for value in values
@@ -354,31 +388,18 @@ class Client(internal.DatabaseInterface):
         return values
 
     def post_site_generation(
-        self, site_uuid: str, generation: list[internal.ActualPower], email: str
+        self, site_uuid: UUID, generation: list[internal.ActualPower], email: str
     ):
         """Post generation for a site"""
 
         with self._get_session() as session:
             check_user_has_access_to_site(session=session, email=email, site_uuid=site_uuid)
 
-            generations = []
-            for pv_actual_value in generation:
-                generations.append(
-                    {
-                        "start_utc": pv_actual_value.Time,
-                        "power_kw": pv_actual_value.PowerKW,
-                        "site_uuid": site_uuid,
-                    }
-                )
-
-            generation_values_df = pd.DataFrame(generations)
             capacity_factor = float(os.getenv("ERROR_GENERATION_CAPACITY_FACTOR", 1.1))
             site = get_site_by_uuid(session=session, site_uuid=site_uuid)
             site_capacity_kw = site.capacity_kw
-            exceeded_capacity = generation_values_df[
-                generation_values_df["power_kw"] > site_capacity_kw * capacity_factor
-            ]
-            if len(exceeded_capacity) > 0:
+            max_power_kw = site_capacity_kw * capacity_factor
+            if any(value.PowerKW > max_power_kw for value in generation):
                 # alert Sentry and return 422 validation error
                 sentry_sdk.capture_message(
                     f"Error processing generation values. "
@@ -398,23 +419,41 @@ class Client(internal.DatabaseInterface):
                     ),
                 )
 
-            insert_generation_values(session, generation_values_df)
+            insert_generation(session, site_uuid=site_uuid, generation=generation)
             session.commit()
 
 
-def check_user_has_access_to_site(session: Session, email: str, site_uuid: str):
+@functools.lru_cache
+def _get_sessionmaker(database_url: str, pool_size: int, max_overflow: int) -> sessionmaker:
+    """Gets the sessionmaker for the url, shared by every client in the process.
+
+    Sharing the sessionmaker shares its engine's connection pool. The engine is built here,
+    rather than by pvsite_datamodel's DatabaseConnection, as that does not take pool options.
+    Connections are checked before use and recycled after 30 minutes, so connections
+    dropped by a database restart or idle timeout are not handed to requests.
+    """
+    engine = create_engine(
+        database_url,
+        echo=False,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+    return sessionmaker(bind=engine)
+
+
+def check_user_has_access_to_site(session: Session, email: str, site_uuid: UUID):
     """
     Checks if a user has access to a site.
     """
 
-    user = get_user_by_email(session=session, email=email)
-    site_uuids = [str(site.site_uuid) for site in user.site_group.sites]
-    site_uuid = str(site_uuid)
+    site_uuids = get_site_uuids_by_email(session=session, email=email)
 
     if site_uuid not in site_uuids:
         raise HTTPException(
             status_code=403,
             detail=f"Forbidden. User ({email}) "
             f"does not have access to this site {site_uuid}. "
-            f"User has access to {site_uuids}",
+            f"User has access to {sorted(str(u) for u in site_uuids)}",
         )
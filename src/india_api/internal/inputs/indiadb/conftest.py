@@ -7,7 +7,7 @@ import pytest
 from pvsite_datamodel.sqlmodels import Base, ForecastSQL, ForecastValueSQL, GenerationSQL, SiteSQL
 from pvsite_datamodel.read.user import get_user_by_email
 from pvsite_datamodel.read.model import get_or_create_model
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
@@ -16,7 +16,17 @@ log = logging.getLogger(__name__)
 
 @pytest.fixture(scope="session")
 def engine():
-    """Database engine fixture."""
+    """Database engine fixture.
+
+    If TEST_DB_URL is set, that database is used rather than starting a container.
+    Its tables are dropped after the tests, so it must only be used for testing.
+    """
+
+    url = os.getenv("TEST_DB_URL")
+    if url is not None:
+        os.environ["DB_URL"] = url
+        yield create_engine(url)
+        return
 
     with PostgresContainer("postgres:14.5") as postgres:
         url = postgres.get_connection_url()
@@ -103,19 +113,19 @@ def generations(db_session, sites):
     """Create some fake generations"""
     start_times = [datetime.today() - timedelta(minutes=x) for x in range(10)]
 
-    all_generations = []
-
-    for site in sites:
-        for i in range(0, 10):
-            generation = GenerationSQL(
-                site_uuid=site.site_uuid,
-                generation_power_kw=i,
-                start_utc=start_times[i],
-                end_utc=start_times[i] + timedelta(minutes=5),
-            )
-            all_generations.append(generation)
-
-    db_session.add_all(all_generations)
+    # insert the rows in one statement, rather than through the ORM unit of work
+    all_generations = [
+        {
+            "site_uuid": site.site_uuid,
+            "generation_power_kw": i,
+            "start_utc": start_times[i],
+            "end_utc": start_times[i] + timedelta(minutes=5),
+        }
+        for site in sites
+        for i in range(0, 10)
+    ]
+
+    db_session.execute(insert(GenerationSQL), all_generations)
     db_session.commit()
 
     return all_generations
@@ -141,7 +151,6 @@ def forecast_values_site(db_session, sites):
 
 
 def make_fake_forecast_values(db_session, sites, model_name):
-    forecast_values = []
     forecast_version: str = "0.0.0"
 
     num_forecasts = 10
@@ -155,32 +164,37 @@ def make_fake_forecast_values(db_session, sites, model_name):
     # get model
     ml_model = get_or_create_model(db_session, model_name)
 
+    # add all the forecasts in one flush, which sets their forecast_uuids
+    forecasts = [
+        ForecastSQL(
+            site_uuid=site.site_uuid, forecast_version=forecast_version, timestamp_utc=timestamp
+        )
+        for site in sites
+        for timestamp in timestamps
+    ]
+    db_session.add_all(forecasts)
+    db_session.flush()
+
     for site in sites:
-        for timestamp in timestamps:
-            forecast: ForecastSQL = ForecastSQL(
-                site_uuid=site.site_uuid, forecast_version=forecast_version, timestamp_utc=timestamp
-            )
-
-            db_session.add(forecast)
-            db_session.commit()
-
-            for i in range(num_values_per_forecast):
-                # Forecasts of 15 minutes.
-                duration = 15
-                horizon = duration * i
-                forecast_value: ForecastValueSQL = ForecastValueSQL(
-                    forecast_power_kw=i,
-                    forecast_uuid=forecast.forecast_uuid,
-                    start_utc=timestamp + timedelta(minutes=horizon),
-                    end_utc=timestamp + timedelta(minutes=horizon + duration),
-                    horizon_minutes=horizon,
-                )
-                forecast_value.ml_model = ml_model
-                site.ml_model = ml_model
-
-                forecast_values.append(forecast_value)
-
-    db_session.add_all(forecast_values)
+        site.ml_model = ml_model
+
+    # Forecasts of 15 minutes.
+    duration = 15
+    # insert the values in one statement, rather than through the ORM unit of work
+    forecast_values = [
+        {
+            "forecast_power_kw": i,
+            "forecast_uuid": forecast.forecast_uuid,
+            "start_utc": forecast.timestamp_utc + timedelta(minutes=duration * i),
+            "end_utc": forecast.timestamp_utc + timedelta(minutes=duration * (i + 1)),
+            "horizon_minutes": duration * i,
+            "ml_model_uuid": ml_model.model_uuid,
+        }
+        for forecast in forecasts
+        for i in range(num_values_per_forecast)
+    ]
+
+    db_session.execute(insert(ForecastValueSQL), forecast_values)
     db_session.commit()
 
     return forecast_values
@@ -0,0 +1,208 @@
+"""Queries against the India database that are not provided by pvsite_datamodel."""
+import datetime as dt
+import uuid
+from typing import Optional
+
+from pvsite_datamodel.sqlmodels import (
+    ForecastSQL,
+    ForecastValueSQL,
+    GenerationSQL,
+    MLModelSQL,
+    SiteAssetType,
+    SiteGroupSiteSQL,
+    SiteSQL,
+    UserSQL,
+)
+from sqlalchemy import ColumnElement, Row, ScalarSelect, Select, func, select, text
+from sqlalchemy.orm import Session
+
+
+def _select_site_by_location(
+    location: str, asset_type: SiteAssetType, region: Optional[str] = None
+) -> Select:
+    """Selects the Indian sites of the asset type whose client name contains the location.
+
+    Args:
+        location: The string to search for in the client site name
+        asset_type: The type of asset the site must be
+        region: If set, the region the site must be in
+    """
+    query = select(SiteSQL).where(
+        SiteSQL.country == "india",
+        SiteSQL.client_site_name.like(f"%{location}%"),
+        SiteSQL.asset_type == asset_type,
+    )
+    if region is not None:
+        query = query.where(SiteSQL.region == region)
+
+    return query.order_by(SiteSQL.site_uuid)
+
+
+def get_site_by_location(
+    session: Session, location: str, asset_type: SiteAssetType, region: Optional[str] = None
+) -> Optional[SiteSQL]:
+    """Gets the first Indian site of the asset type whose client name contains the location.
+
+    The filters run in the database, so only the one site is loaded.
+
+    Args:
+        session: The database session
+        location: The string to search for in the client site name
+        asset_type: The type of asset the site must be
+        region: If set, the region the site must be in
+    """
+    return session.scalars(_select_site_by_location(location, asset_type, region).limit(1)).first()
+
+
+def get_site_uuids_by_email(session: Session, email: str) -> set[uuid.UUID]:
+    """Gets the uuids of the sites in the site group of the user with the email.
+
+    This is one query, rather than loading the user, site group and sites objects in turn.
+    The uuids are returned as a set, so checking a site is in it does not depend on
+    how many sites the user has.
+
+    Args:
+        session: The database session
+        email: The email of the user
+    """
+    query = (
+        select(SiteGroupSiteSQL.site_uuid)
+        .join(UserSQL, UserSQL.site_group_uuid == SiteGroupSiteSQL.site_group_uuid)
+        .where(UserSQL.email == email)
+    )
+
+    return set(session.scalars(query))
+
+
+def _power_kw(column: ColumnElement) -> ColumnElement:
+    """Labels the power column as power_kw, with negative values set to 0 and truncated to kW."""
+    return func.floor(func.greatest(column, 0)).label("power_kw")
+
+
+def _select_generation(
+    site_uuid: uuid.UUID | ScalarSelect[uuid.UUID], start_utc: dt.datetime, end_utc: dt.datetime
+) -> Select:
+    """Selects the power_kw and start_utc of a site's generation in the window, in time order.
+
+    Args:
+        site_uuid: The site's uuid, or a subquery selecting it
+        start_utc: Only get generation starting at or after this time
+        end_utc: Only get generation ending before this time
+    """
+    return (
+        select(_power_kw(GenerationSQL.generation_power_kw), GenerationSQL.start_utc)
+        .where(
+            GenerationSQL.site_uuid == site_uuid,
+            GenerationSQL.start_utc >= start_utc,
+            GenerationSQL.end_utc < end_utc,
+        )
+        .order_by(GenerationSQL.start_utc)
+    )
+
+
+def get_generation_by_site(
+    session: Session, site_uuid: uuid.UUID, start_utc: dt.datetime, end_utc: dt.datetime
+) -> list[Row]:
+    """Gets the power_kw and start_utc of a site's generation, in time order.
+
+    Args:
+        session: The database session
+        site_uuid: The site to get the generation for
+        start_utc: Only get generation starting at or after this time
+        end_utc: Only get generation ending before this time
+    """
+    return list(session.execute(_select_generation(site_uuid, start_utc, end_utc)))
+
+
+def get_generation_by_location(
+    session: Session,
+    location: str,
+    asset_type: SiteAssetType,
+    start_utc: dt.datetime,
+    end_utc: dt.datetime,
+) -> list[Row]:
+    """Gets the power_kw and start_utc of the generation of the location's site, in time order.
+
+    The site is the one found by get_site_by_location. It is looked up in a subquery,
+    so this is a single round trip to the database.
+
+    Args:
+        session: The database session
+        location: The string to search for in the client site name
+        asset_type: The type of asset the site must be
+        start_utc: Only get generation starting at or after this time
+        end_utc: Only get generation ending before this time
+    """
+    site_uuid = (
+        _select_site_by_location(location, asset_type)
+        .with_only_columns(SiteSQL.site_uuid)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    return list(session.execute(_select_generation(site_uuid, start_utc, end_utc)))
+
+
+def get_latest_forecast_values(
+    session: Session,
+    site_uuid: uuid.UUID,
+    start_utc: dt.datetime,
+    model_name: str,
+    day_ahead_hours: Optional[int] = None,
+    day_ahead_timezone_delta_hours: Optional[float] = None,
+    forecast_horizon_minutes: Optional[int] = None,
+) -> list[Row]:
+    """Gets the latest forecast value for each time of a site, in time order.
+
+    This matches pvsite_datamodel's get_latest_forecast_values_by_site for a single site,
+    but only selects the power_kw, start_utc and created_utc columns,
+    so no ORM objects are built.
+
+    Args:
+        session: The database session
+        site_uuid: The site to get the forecast values for
+        start_utc: Only get forecast values starting at or after this time
+        model_name: Only get forecast values made by the ml model of this name
+        day_ahead_hours: If set, only get forecast values made before this hour
+            of the day before the value, in the timezone given by the delta below
+        day_ahead_timezone_delta_hours: The timezone's offset from UTC, in hours
+        forecast_horizon_minutes: If set, only get forecast values with at least this horizon
+    """
+    query = (
+        select(
+            _power_kw(ForecastValueSQL.forecast_power_kw),
+            ForecastValueSQL.start_utc,
+            ForecastValueSQL.created_utc,
+        )
+        .distinct(ForecastValueSQL.start_utc)
+        .join(ForecastSQL, ForecastValueSQL.forecast_uuid == ForecastSQL.forecast_uuid)
+        .join(MLModelSQL, ForecastValueSQL.ml_model_uuid == MLModelSQL.model_uuid)
+        .where(
+            ForecastSQL.site_uuid == site_uuid,
+            ForecastValueSQL.start_utc >= start_utc,
+            MLModelSQL.name == model_name,
+        )
+    )
+
+    if forecast_horizon_minutes is not None:
+        query = query.where(ForecastValueSQL.horizon_minutes >= forecast_horizon_minutes)
+
+    if day_ahead_hours:
+        # Only keep values made before day_ahead_hours o'clock local time, the day before
+        delta_minutes = int((day_ahead_timezone_delta_hours or 0) * 60)
+        query = query.where(
+            ForecastValueSQL.created_utc
+            <= text(
+                f"date(forecast_values.start_utc + interval '{delta_minutes}' minute "
+                f"- interval '1' day) + interval '{day_ahead_hours}' hour "
+                f"- interval '{delta_minutes}' minute"
+            )
+        )
+
+    query = query.order_by(
+        ForecastValueSQL.start_utc,
+        ForecastSQL.timestamp_utc.desc(),
+        ForecastSQL.created_utc.desc(),
+    )
+
+    return list(session.execute(query))
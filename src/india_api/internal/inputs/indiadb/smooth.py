@@ -1,32 +1,54 @@
-import pandas as pd
+"""Smooths forecast values, so they do not jump between consecutive times."""
+import functools
+
+import numpy as np
+
 from india_api.internal import PredictedPower
 
+# number of values in each rolling mean
+window = 4
+
 
 def smooth_forecast(values: list[PredictedPower]) -> list[PredictedPower]:
-    """Smooths the forecast values."""
-    # convert to dataframe
-    df = pd.DataFrame(
-        {
-            "Time": [value.Time for value in values],
-            "PowerKW": [value.PowerKW for value in values],
-        }
-    )
-
-    # smooth and make sure it is symmetrical
-    df = df.set_index("Time")
-    # try to do this in one step, but couldnt, center=True and closed='both' didnt work
-    df = (df.rolling(4, min_periods=1).mean() + df[::-1].rolling(4, min_periods=1).mean())/2.0
+    """Smooths the forecast values.
 
-    # convert to ints
-    df["PowerKW"] = df["PowerKW"].astype(int)
-    df["CreatedTime"] = [value.CreatedTime for value in values]
+    Each value is the average of the backward and forward rolling means of up to
+    `window` values, so the smoothing is symmetrical.
+    """
+    smoothed = _smooth_powers(tuple(value.PowerKW for value in values))
 
     # convert back to list of PredictedPower
     return [
         PredictedPower(
-            Time=index,
-            PowerKW=row.PowerKW,
-            CreatedTime=row.CreatedTime,
+            Time=value.Time,
+            PowerKW=power_kw,
+            CreatedTime=value.CreatedTime,
         )
-        for index, row in df.iterrows()
+        for value, power_kw in zip(values, smoothed, strict=True)
     ]
+
+
+@functools.lru_cache(maxsize=256)
+def _smooth_powers(powers: tuple[float, ...]) -> tuple[int, ...]:
+    """Smooths the powers, as whole kW.
+
+    The means are computed from a cumulative sum, rather than through a DataFrame.
+    The result is cached, as the same forecast is smoothed for every request until
+    a new one is made.
+    """
+    n = len(powers)
+    if n == 0:
+        return ()
+
+    cumulative = np.concatenate(([0.0], np.cumsum(powers, dtype=np.float64)))
+
+    # the backward window ends at each value, the forward window starts at it,
+    # and both are cut short at the ends, as with rolling(min_periods=1)
+    index = np.arange(n)
+    backward_start = np.maximum(index - (window - 1), 0)
+    forward_end = np.minimum(index + window, n)
+    backward = (cumulative[index + 1] - cumulative[backward_start]) / (index + 1 - backward_start)
+    forward = (cumulative[forward_end] - cumulative[index]) / (forward_end - index)
+
+    # convert to ints
+    return tuple(((backward + forward) / 2.0).astype(np.int64).tolist())
@@ -1,12 +1,18 @@
 import logging
+import types
+import uuid
+from datetime import datetime, timedelta
+
 from fastapi import HTTPException
 import pytest
 
 from india_api.internal import PredictedPower, ActualPower
 
-from pvsite_datamodel.sqlmodels import APIRequestSQL
+from pvsite_datamodel.sqlmodels import APIRequestSQL, GenerationSQL, SiteAssetType
 
+from . import client as client_module
 from .client import Client
+from .smooth import smooth_forecast
 
 log = logging.getLogger(__name__)
 
@@ -50,6 +56,59 @@ class TestIndiaDBClient:
         for record in result:
             assert isinstance(record, PredictedPower)
 
+    def test_get_predicted_solar_power_production_for_location_reuses_site(
+        self, client, forecast_values
+    ) -> None:
+        first = client.get_predicted_solar_power_production_for_location("testID")
+        assert ("testID", SiteAssetType.pv) in client._sites
+
+        second = client.get_predicted_solar_power_production_for_location("testID")
+        assert len(second) == len(first)
+
+    def test_get_site_for_location_across_bucket_changes(self, client, monkeypatch) -> None:
+        lookups = []
+
+        def get_site_by_location(*args, **kwargs):
+            lookups.append(args)
+            return types.SimpleNamespace(site_uuid=uuid.uuid4(), ml_model=None)
+
+        monkeypatch.setattr(client_module, "get_site_by_location", get_site_by_location)
+        # Two reads of the clock in each of two buckets
+        times = iter([5, 5.5, 6, 6.5])
+        fake_time = lambda: next(times) * client_module.site_cache_seconds  # noqa: E731
+        monkeypatch.setattr(client_module, "time", types.SimpleNamespace(time=fake_time))
+
+        results = [
+            client._get_site_for_location(None, "testID", SiteAssetType.pv) for _ in range(4)
+        ]
+
+        # The site is looked up once per bucket, and refreshed when the bucket changes
+        assert len(lookups) == 2
+        assert results[0] == results[1]
+        assert results[2] == results[3]
+        assert results[2] != results[1]
+        assert client._sites_bucket == 6
+
+    def test_get_site_for_location_ignores_stale_clock(self, client, monkeypatch) -> None:
+        lookups = []
+
+        def get_site_by_location(*args, **kwargs):
+            lookups.append(args)
+            return types.SimpleNamespace(site_uuid=uuid.uuid4(), ml_model=None)
+
+        monkeypatch.setattr(client_module, "get_site_by_location", get_site_by_location)
+        # The second read is from a thread that read the clock just before the rollover
+        times = iter([5, 4.99])
+        fake_time = lambda: next(times) * client_module.site_cache_seconds  # noqa: E731
+        monkeypatch.setattr(client_module, "time", types.SimpleNamespace(time=fake_time))
+
+        first = client._get_site_for_location(None, "testID", SiteAssetType.pv)
+        second = client._get_site_for_location(None, "testID", SiteAssetType.pv)
+
+        assert second == first
+        assert len(lookups) == 1
+        assert client._sites_bucket == 5
+
     def test_get_actual_wind_power_production_for_location(self, client, generations) -> None:
         locID = "testID"
         result = client.get_actual_wind_power_production_for_location(locID)
@@ -66,6 +125,15 @@ class TestIndiaDBClient:
         for record in result:
             assert isinstance(record, ActualPower)
 
+    def test_get_actual_power_production_for_location_no_site(self, client, sites) -> None:
+        with pytest.raises(HTTPException) as e:
+            client.get_actual_solar_power_production_for_location("testID2")
+        assert e.value.status_code == 204
+
+    def test_get_actual_power_production_for_location_no_generation(self, client, sites) -> None:
+        result = client.get_actual_solar_power_production_for_location("testID")
+        assert result == []
+
     def test_get_wind_regions(self, client) -> None:
         result = client.get_wind_regions()
         assert len(result) == 1
@@ -85,7 +153,7 @@ class TestIndiaDBClient:
         assert len(sites_from_api) == 0
 
     def test_get_site_forecast(self, client, sites, forecast_values_site) -> None:
-        out = client.get_site_forecast(site_uuid=str(sites[0].site_uuid), email="test@test.com")
+        out = client.get_site_forecast(site_uuid=sites[0].site_uuid, email="test@test.com")
         assert len(out) > 0
 
     def test_get_site_forecast_no_forecast_values(self, client, sites) -> None:
@@ -97,7 +165,7 @@ class TestIndiaDBClient:
             _ = client.get_site_forecast(site_uuid=sites[0].site_uuid, email="test2@test.com")
 
     def test_get_site_generation(self, client, sites, generations) -> None:
-        out = client.get_site_generation(site_uuid=str(sites[0].site_uuid), email="test@test.com")
+        out = client.get_site_generation(site_uuid=sites[0].site_uuid, email="test@test.com")
         assert len(out) > 0
 
     def test_post_site_generation(self, client, sites) -> None:
@@ -107,6 +175,17 @@ class TestIndiaDBClient:
             email="test@test.com",
         )
 
+    def test_post_site_generation_inserts_values(self, client, db_session, sites) -> None:
+        client.post_site_generation(
+            site_uuid=sites[0].site_uuid,
+            generation=[ActualPower(Time=1, PowerKW=1), ActualPower(Time=301, PowerKW=2)],
+            email="test@test.com",
+        )
+
+        generations = db_session.query(GenerationSQL).order_by(GenerationSQL.start_utc).all()
+        assert [g.generation_power_kw for g in generations] == [1, 2]
+        assert generations[0].end_utc - generations[0].start_utc == timedelta(minutes=5)
+
     def test_post_site_generation_exceding_max_capacity(self, client, sites):
         try:
             client.post_site_generation(
@@ -116,4 +195,36 @@ class TestIndiaDBClient:
             )
         except HTTPException as e:
             assert e.status_code == 422 
-            assert "generation values" in str(e.detail)
\ No newline at end of file
+            assert "generation values" in str(e.detail)
+
+    def test_get_site_generation_clamps_and_truncates(self, client, db_session, sites) -> None:
+        start_utc = datetime.utcnow() - timedelta(hours=1)
+        db_session.add_all(
+            [
+                GenerationSQL(
+                    site_uuid=sites[0].site_uuid,
+                    generation_power_kw=power_kw,
+                    start_utc=start_utc + timedelta(minutes=15 * i),
+                    end_utc=start_utc + timedelta(minutes=15 * (i + 1)),
+                )
+                for i, power_kw in enumerate([-5.0, 2.7])
+            ]
+        )
+        db_session.commit()
+
+        out = client.get_site_generation(site_uuid=sites[0].site_uuid, email="test@test.com")
+        assert [record.PowerKW for record in out] == [0, 2]
+
+
+def test_smooth_forecast() -> None:
+    now = datetime.utcnow()
+    values = [
+        PredictedPower(Time=now + timedelta(minutes=15 * i), PowerKW=power_kw, CreatedTime=now)
+        for i, power_kw in enumerate([0, 4, 8, 12, 16])
+    ]
+
+    out = smooth_forecast(values)
+
+    assert [record.PowerKW for record in out] == [3, 6, 8, 10, 13]
+    assert [record.Time for record in out] == [record.Time for record in values]
+    assert smooth_forecast([]) == []
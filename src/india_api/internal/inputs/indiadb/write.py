@@ -0,0 +1,49 @@
+"""Writes to the India database that are not provided by pvsite_datamodel."""
+import datetime as dt
+import logging
+from uuid import UUID
+
+from pvsite_datamodel.sqlmodels import GenerationSQL
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from india_api import internal
+
+log = logging.getLogger(__name__)
+
+# Each generation value is taken to last this long, as in pvsite_datamodel
+generation_duration = dt.timedelta(minutes=5)
+
+
+def insert_generation(
+    session: Session, site_uuid: UUID, generation: list[internal.ActualPower]
+) -> None:
+    """Inserts a site's generation values, skipping any that conflict with existing rows.
+
+    This matches pvsite_datamodel's insert_generation_values, but builds the rows directly
+    rather than through a DataFrame and GenerationSQL objects. They are inserted in one
+    executemany, which SQLAlchemy batches.
+
+    Args:
+        session: The database session
+        site_uuid: The site the generation is for
+        generation: The generation values to insert
+    """
+    if len(generation) == 0:
+        return
+
+    if len({value.Time for value in generation}) < len(generation):
+        log.warning(f'duplicate target datetimes for site "{site_uuid}"')
+
+    rows = [
+        {
+            "site_uuid": site_uuid,
+            "generation_power_kw": value.PowerKW,
+            "start_utc": value.Time,
+            "end_utc": value.Time + generation_duration,
+        }
+        for value in generation
+    ]
+
+    stmt = postgresql.insert(GenerationSQL.__table__).on_conflict_do_nothing()
+    session.execute(stmt, rows)
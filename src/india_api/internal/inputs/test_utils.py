@@ -0,0 +1,25 @@
+import datetime as dt
+
+from .utils import _get_window_for_day, get_window
+
+
+def test_get_window():
+    start, end = get_window()
+
+    assert end - start == dt.timedelta(days=4)
+    assert start.time() == dt.time(0, 0)
+    assert start <= dt.datetime.now(tz=dt.UTC) < end
+
+
+def test_get_window_for_day_at_midnight():
+    midnight = dt.datetime(2024, 6, 1, tzinfo=dt.UTC)
+    day = int(midnight.timestamp()) // 86400
+
+    # The second before midnight belongs to the previous day's window
+    assert _get_window_for_day((int(midnight.timestamp()) - 1) // 86400)[0] == dt.datetime(
+        2024, 5, 29, tzinfo=dt.UTC
+    )
+    assert _get_window_for_day(day) == (
+        dt.datetime(2024, 5, 30, tzinfo=dt.UTC),
+        dt.datetime(2024, 6, 3, tzinfo=dt.UTC),
+    )
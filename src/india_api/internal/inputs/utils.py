@@ -1,20 +1,23 @@
 import datetime as dt
+import functools
+import time
+
+# The window only changes at midnight UTC, so it is calculated once per day of this many seconds.
+# Unix time has no leap seconds, so every UTC day starts at a multiple of it.
+_day_seconds = 86400
 
 
 def get_window() -> tuple[dt.datetime, dt.datetime]:
     """Returns the start and end of the window for timeseries data."""
+    return _get_window_for_day(int(time.time()) // _day_seconds)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_window_for_day(day: int) -> tuple[dt.datetime, dt.datetime]:
+    """Returns the window for the UTC day starting at day * _day_seconds in unix time."""
+    midnight = dt.datetime.fromtimestamp(day * _day_seconds, tz=dt.UTC)
     # Window start is the beginning of the day two days ago
-    start = (dt.datetime.now(tz=dt.UTC) - dt.timedelta(days=2)).replace(
-        hour=0,
-        minute=0,
-        second=0,
-        microsecond=0,
-    )
+    start = midnight - dt.timedelta(days=2)
     # Window end is the beginning of the day two days ahead
-    end = (dt.datetime.now(tz=dt.UTC) + dt.timedelta(days=2)).replace(
-        hour=0,
-        minute=0,
-        second=0,
-        microsecond=0,
-    )
-    return (start, end)
\ No newline at end of file
+    end = midnight + dt.timedelta(days=2)
+    return (start, end)
@@ -3,6 +3,7 @@
 import abc
 import datetime as dt
 from typing import List, Optional
+from uuid import UUID
 
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -99,7 +100,7 @@ class DatabaseInterface(abc.ABC):
 
     @abc.abstractmethod
     def get_actual_solar_power_production_for_location(self, location: str) -> list[ActualPower]:
-        """Returns a list of actual solar power production for a given location."""
+        """Returns a list of actual solar power production for a given location, in time order."""
         pass
 
     @abc.abstractmethod
@@ -115,7 +116,7 @@ class DatabaseInterface(abc.ABC):
 
     @abc.abstractmethod
     def get_actual_wind_power_production_for_location(self, location: str) -> list[ActualPower]:
-        """Returns a list of actual wind power production for a given location."""
+        """Returns a list of actual wind power production for a given location, in time order."""
         pass
 
     @abc.abstractmethod
@@ -139,16 +140,18 @@ class DatabaseInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_site_forecast(self, site_uuid: str, email:str) -> list[PredictedPower]:
+    def get_site_forecast(self, site_uuid: UUID, email:str) -> list[PredictedPower]:
         """Get a forecast for a site"""
         pass
 
     @abc.abstractmethod
-    def get_site_generation(self, site_uuid: str, email:str) -> list[ActualPower]:
-        """Get the generation for a site"""
+    def get_site_generation(self, site_uuid: UUID, email:str) -> list[ActualPower]:
+        """Get the generation for a site, in time order"""
         pass
 
     @abc.abstractmethod
-    def post_site_generation(self, site_uuid: str, generation: list[ActualPower], email:str) -> None:
+    def post_site_generation(
+        self, site_uuid: UUID, generation: list[ActualPower], email: str
+    ) -> None:
         """Post the generation for a site"""
         pass
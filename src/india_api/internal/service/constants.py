@@ -1,3 +1,3 @@
-import pytz
+from zoneinfo import ZoneInfo
 
-local_tz = pytz.timezone("Asia/Kolkata")
+local_tz = ZoneInfo("Asia/Kolkata")
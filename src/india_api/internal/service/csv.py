@@ -3,6 +3,9 @@ from datetime import datetime
 
 from india_api.internal import PredictedPower
 
+# the length of each forecast period, used to get the end time of each row
+forecast_period = pd.Timedelta(minutes=15)
+
 
 def format_csv_and_created_time(values: list[PredictedPower]) -> (pd.DataFrame, datetime):
     """
@@ -26,7 +29,7 @@ def format_csv_and_created_time(values: list[PredictedPower]) -> (pd.DataFrame,
     df["Date [IST]"] = df["Time"].dt.date
     # create start and end time column and only show HH:MM
     df["Start Time [IST]"] = df["Time"].dt.strftime("%H:%M")
-    df["End Time [IST]"] = (df["Time"] + pd.to_timedelta("15T")).dt.strftime("%H:%M")
+    df["End Time [IST]"] = (df["Time"] + forecast_period).dt.strftime("%H:%M")
 
     # combine start and end times
     df["Time"] = df["Start Time [IST]"].astype(str) + " - " + df["End Time [IST]"].astype(str)
@@ -1,3 +1,4 @@
+import bisect
 import datetime as dt
 from typing import Optional, Annotated
 
@@ -33,7 +34,7 @@ class GetSourcesResponse(BaseModel):
     status_code=status.HTTP_200_OK,
     include_in_schema=False,
 )
-def get_sources_route(auth: dict = Depends(auth)) -> GetSourcesResponse:
+async def get_sources_route(auth: dict = Depends(auth)) -> GetSourcesResponse:
     """Function for the sources route."""
 
     return GetSourcesResponse(sources=["wind", "solar"])
@@ -106,6 +107,9 @@ def get_historic_timeseries_route(
             values = db.get_actual_wind_power_production_for_location(location=region)
         elif source == "solar":
             values = db.get_actual_solar_power_production_for_location(location=region)
+    except HTTPException:
+        # Errors from the database client, such as 204 for an unknown region, are kept
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -115,8 +119,12 @@ def get_historic_timeseries_route(
     if resample_minutes is not None:
         values = resample_generation(values=values, internal_minutes=resample_minutes)
 
+    # The values are in time order, so drop any in the future by bisecting for the current time
+    now = dt.datetime.now(tz=dt.UTC)
+    values = values[: bisect.bisect_left(values, now, key=lambda y: y.Time)]
+
     return GetHistoricGenerationResponse(
-        values=[y.to_timezone(tz=local_tz) for y in values if y.Time < dt.datetime.now(tz=dt.UTC)],
+        values=[y.to_timezone(tz=local_tz) for y in values],
     )
 
 
@@ -170,6 +178,9 @@ def get_forecast_timeseries_route(
                 forecast_horizon_minutes=forecast_horizon_minutes,
                 smooth_flag=smooth_flag,
             )
+    except HTTPException:
+        # Errors from the database client, such as 204 for an unknown region, are kept
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5,6 +5,7 @@ import os
 import sys
 
 from fastapi import FastAPI, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -110,7 +111,8 @@ async def save_api_request_to_db(request: Request, call_next):
     params = request.url.query
     url_and_query = f"{url}?{params}"
 
-    db.save_api_call_to_db(url=url_and_query, email=email)
+    # The database clients are blocking, so keep them off the event loop
+    await run_in_threadpool(db.save_api_call_to_db, url=url_and_query, email=email)
 
     return response
 
@@ -131,6 +133,6 @@ class GetHealthResponse(BaseModel):
     tags=["API Information"],
     status_code=status.HTTP_200_OK,
 )
-def get_health_route() -> GetHealthResponse:
+async def get_health_route() -> GetHealthResponse:
     """Health endpoint for the API."""
     return GetHealthResponse(status=status.HTTP_200_OK)
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from starlette import status
 
 from fastapi import APIRouter, Depends
@@ -31,7 +33,7 @@ def get_sites(db: DBClientDependency, auth: dict = Depends(auth)) -> list[Site]:
     status_code=status.HTTP_200_OK,
 )
 def get_forecast(
-    site_uuid: str, db: DBClientDependency, auth: dict = Depends(auth)
+    site_uuid: UUID, db: DBClientDependency, auth: dict = Depends(auth)
 ) -> list[PredictedPower]:
     """Get forecast of a site"""
 
@@ -48,7 +50,7 @@ def get_forecast(
     status_code=status.HTTP_200_OK,
 )
 def get_generation(
-    site_uuid: str, db: DBClientDependency, auth: dict = Depends(auth)
+    site_uuid: UUID, db: DBClientDependency, auth: dict = Depends(auth)
 ) -> list[ActualPower]:
     """Get get generation fo a site"""
 
@@ -65,7 +67,7 @@ def get_generation(
     status_code=status.HTTP_200_OK,
 )
 def post_generation(
-    site_uuid: str,
+    site_uuid: UUID,
     generation: list[ActualPower],
     db: DBClientDependency,
     auth: dict = Depends(auth),